@@ -6,10 +6,13 @@ import sys
 import copy
 import logging
 import warnings
+from enum import IntEnum
+from operator import itemgetter
 from typing import List, Set, Union
 from dataclasses import dataclass
 from contextlib import contextmanager
 from collections import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 
 from rez.vendor import yaml
 from rez.suite import Suite
@@ -39,10 +42,26 @@ from .exceptions import (
 log = logging.getLogger("sweet")
 
 
-sweetconfig = rezconfig.plugins.command.sweet
+def _sweetconfig():
+    # resolving the plugin config walks rez's plugin registry, which is
+    # heavy enough to defer until a caller actually needs it.
+    global _sweetconfig_cache
+    if _sweetconfig_cache is None:
+        _sweetconfig_cache = rezconfig.plugins.command.sweet
+    return _sweetconfig_cache
+
+
+_sweetconfig_cache = None
 # todo: load rezconfig from suite-saving path
 
 
+def __getattr__(name):
+    if name == "sweetconfig":  # kept lazy, see _sweetconfig
+        return _sweetconfig()
+    raise AttributeError(
+        "module %r has no attribute %r" % (__name__, name))
+
+
 __all__ = (
     "SuiteOp",
     "Storage",
@@ -57,11 +76,12 @@ __all__ = (
 
     "Constants",
 
+    "batch_warnings",
     "re_resolve_rxt",
 )
 
 
-class Constants:
+class Constants(IntEnum):
     # suite tool status code
     #
     TOOL_VALID = 0
@@ -179,8 +199,47 @@ class SavedSuite:
         return sop.iter_contexts(ascending=ascending)
 
 
+_warning_buffer = None  # type: list or None
+
+
+@contextmanager
+def batch_warnings():
+    """Buffer suite-op warnings and flush them deduplicated on exit
+
+    For wrapping bulk suite operations, e.g. re-adding one context with a
+    loop of tool updates, so repeated warnings get issued only once after
+    the batch instead of one per call.
+
+    :return: None
+    """
+    global _warning_buffer
+    if _warning_buffer is not None:
+        yield  # already batching in outer scope
+        return
+
+    _warning_buffer = []
+    try:
+        yield
+    finally:
+        buffered, _warning_buffer = _warning_buffer, None
+        seen = set()
+        for message, category in buffered:
+            key = (category, message)
+            if key not in seen:
+                seen.add(key)
+                warnings.warn(message, category=category, stacklevel=2)
+
+
+_priority_key = itemgetter("priority")
+
+_empty_context = None  # type: RollingContext or None
+
+
 def _warn(message, category=None):
     category = category or SuiteOpWarning
+    if _warning_buffer is not None:
+        _warning_buffer.append((message, category))
+        return
     warnings.warn(message, category=category, stacklevel=2)
 
 
@@ -205,13 +264,14 @@ class SuiteOp(object):
     def dump(self):
         suite_dict = self._suite.to_dict()
 
+        ctx_dicts = suite_dict["contexts"]
         for name, data in self._suite.contexts.items():
+            ctx_dict = ctx_dicts[name]
             context = data.get("context")
             if context:
-                suite_dict["contexts"][name]["context"] = context.copy()
-            loaded = data.get("loaded")
-            if loaded:
-                suite_dict["contexts"][name]["loaded"] = True
+                ctx_dict["context"] = context.copy()
+            if data.get("loaded"):
+                ctx_dict["loaded"] = True
 
         return suite_dict
 
@@ -257,6 +317,7 @@ class SuiteOp(object):
         :param bool as_archived: Save suite as archived
         :return: None
         """
+        sweetconfig = _sweetconfig()
         release_root = sweetconfig.suite_roots.get(sweetconfig.release_root)
         non_local_required = \
             util.normpath(release_root) == os.path.dirname(util.normpath(path))
@@ -298,10 +359,16 @@ class SuiteOp(object):
             raise SuiteOpError(e)
 
         if non_local:
-            non_local_paths = util.normpaths(*rezconfig.nonlocal_packages_path)
+            non_local_paths = \
+                set(util.normpaths(*rezconfig.nonlocal_packages_path))
+            _norm = {}  # variants mostly share locations, normalize once
             for ctx in self.iter_contexts():
                 for variant in ctx.resolves:
-                    norm_location = util.normpath(variant.resource.location)
+                    location = variant.resource.location
+                    norm_location = _norm.get(location)
+                    if norm_location is None:
+                        norm_location = util.normpath(location)
+                        _norm[location] = norm_location
                     if norm_location not in non_local_paths:
                         raise SuiteReleaseError(
                             "Non-local packages check has enabled, and found "
@@ -335,6 +402,11 @@ class SuiteOp(object):
     def resolve_context(self, requests, package_paths=None):
         """Try resolving a context
 
+        An empty request is resolved into a shared placeholder context,
+        so e.g. adding many not-yet-requested contexts doesn't spin up
+        the solver over and over. The suite copies contexts on add and
+        update, hence sharing is safe.
+
         :param requests: List of strings or PackageRequest objects representing
             the request for resolving a context.
         :param list package_paths: Package paths to resolve with, default None
@@ -342,6 +414,11 @@ class SuiteOp(object):
         :return: A RollingContext object
         :rtype: RollingContext
         """
+        if not requests and package_paths is None:
+            global _empty_context
+            if _empty_context is None:
+                _empty_context = RollingContext([])
+            return _empty_context
         return RollingContext(requests, package_paths=package_paths)
 
     def add_context(self, name, context):
@@ -411,7 +488,7 @@ class SuiteOp(object):
         :raises SuiteOpError: If `new_order` not matching all context names
             in suite.
         """
-        if set(new_order) != set(self._suite.contexts.keys()):
+        if set(new_order) != self._suite.contexts.keys():
             raise SuiteOpError("Input context names not matching current "
                                "suites.")
 
@@ -582,17 +659,21 @@ class SuiteOp(object):
         By default (descending ordered), the context that has higher priority
         will be iterated first.
 
+        Note that the yielded SuiteCtx carries the suite's own context
+        object, not a copy — treat it as read-only, or use `get_context`
+        for a mutable copy.
+
         :param ascending: Iter contexts by priority in ascending order.
         :type ascending: bool or False
         :return: An SuiteCtx object iterator
         :rtype: collections.Iterator[SuiteCtx]
         """
-        ctx_data = sorted(
-            self._suite.contexts.values(), key=lambda x: x["priority"],
-            reverse=not ascending
-        )
+        ctx_data = self._suite.sorted_contexts()
+        if not ascending:
+            ctx_data = reversed(ctx_data)
+        to_tuple = self._ctx_data_to_tuple
         for d in ctx_data:
-            yield self._ctx_data_to_tuple(d)
+            yield to_tuple(d)
 
     def iter_tools(
             self,
@@ -621,9 +702,7 @@ class SuiteOp(object):
         """
         self._suite.update_tools(suppress_err=suppress_err)
         _visible = set()
-
-        def _match_context(d_):
-            return context_name is None or context_name == d_["context_name"]
+        to_tuple = self._tool_data_to_tuple
 
         def _ensure_unpacked(d_, s):
             # note:
@@ -635,51 +714,54 @@ class SuiteOp(object):
             #  See `TestCore.test_tool_by_multi_packages`.
             if isinstance(d_["variant"], set):
                 for variant in d_["variant"]:
-                    yield self._tool_data_to_tuple(d_, variant, status=s)
+                    yield to_tuple(d_, variant, status=s)
             else:
-                yield self._tool_data_to_tuple(d_, status=s)
+                yield to_tuple(d_, status=s)
 
         status = Constants.TOOL_VALID
         for d in self._suite.tools.values():
             _visible.add(d["tool_alias"])
-            if _match_context(d):
-                for t in _ensure_unpacked(d, status):
-                    yield t
+            if context_name is None or context_name == d["context_name"]:
+                yield from _ensure_unpacked(d, status)
 
         if visible_only:
             return
 
         status = Constants.TOOL_HIDDEN
         for d in self._suite.hidden_tools:
-            if _match_context(d):
-                for t in _ensure_unpacked(d, status):
-                    yield t
+            if context_name is None or context_name == d["context_name"]:
+                yield from _ensure_unpacked(d, status)
 
         status = Constants.TOOL_SHADOWED
         for entries in self._suite.tool_conflicts.values():
             for d in entries:
-                if _match_context(d):
-                    for t in _ensure_unpacked(d, status):
-                        yield t
+                if context_name is None or context_name == d["context_name"]:
+                    yield from _ensure_unpacked(d, status)
 
         status = Constants.TOOL_MISSING
-        for _tool in self._previous_tools or []:
-            if _match_context(_tool.ctx_name):
-                if _tool.alias not in _visible:
-                    _tool.status = status
-                    yield _tool
+        for _tool in self._previous_tools or ():
+            if _tool.alias in _visible:
+                continue  # steady state, most saved tools remain visible
+            if context_name is None or context_name == _tool.ctx_name:
+                _tool.status = status
+                yield _tool
 
     def _ctx_tool_exists(self, context, tool_name):
-        context_tools = context.get_tools(request_only=True)
-        for _, tool_names in context_tools.values():
-            if tool_name in tool_names:
-                return True
-        return False
+        tool_names = getattr(context, "_tool_names", None)
+        if tool_names is None:
+            context_tools = context.get_tools(request_only=True)
+            tool_names = {
+                t for _, names in context_tools.values() for t in names
+            }
+            if context.err_on_get_tools is None:
+                # a resolved context's tools won't change, safe to keep
+                context._tool_names = tool_names
+        return tool_name in tool_names
 
     def _ctx_data_to_tuple(self, d):
         context = self._suite.context(d["name"])
-        rq = [r for r in context.requested_packages()]
-        rs = [r for r in context.resolved_packages]
+        rq = list(context.requested_packages())
+        rs = list(context.resolved_packages)
         return SuiteCtx(
             name=d["name"],
             priority=d["priority"],
@@ -816,7 +898,7 @@ class Storage(object):
         :param roots: Storage roots, branch name as key and path as value.
         :type roots: dict
         """
-        roots = roots or sweetconfig.suite_roots  # type: dict
+        roots = roots or _sweetconfig().suite_roots  # type: dict
         assert isinstance(roots, MutableMapping), (
             f"Expect dict-like object, got {type(roots)}"
         )  # note: this is for the arg `roots`, there's type check in rezconfig
@@ -826,7 +908,7 @@ class Storage(object):
     def __repr__(self):
         return "%s(%s)" % (
             self.__class__.__name__,
-            ", ".join("%s=%s" % (b, path) for b, path in self._roots)
+            ", ".join("%s=%s" % (b, path) for b, path in self._roots.items())
         )
 
     @classmethod
@@ -897,30 +979,35 @@ class Storage(object):
         # todo:
         #   implement a package release hook that checks if tools consists.
 
+        sep = os.sep
+        isfile = os.path.isfile
+        flag_name = self.ArchivedFlag
+
         for b, root in self._roots.items():
             if branch and b != branch:
                 continue
 
-            if not os.path.isdir(root):
-                continue
-
-            for name in os.listdir(root):
-                path = os.path.join(root, name)
-                filepath = os.path.join(path, "suite.yaml")
-
-                if os.path.isfile(filepath):
-                    archive_flag = os.path.join(path, self.ArchivedFlag)
-                    is_archived = os.path.isfile(archive_flag)
-                    _keys = dict(
-                        name=name,
-                        branch=b,
-                        path=path,
-                        suite=None,  # lazy load
-                    )
-                    if archived and is_archived:
-                        yield SavedSuite(archived=True, **_keys)
-                    elif not archived and not is_archived:
-                        yield SavedSuite(archived=False, **_keys)
+            try:
+                entries = os.scandir(root)
+            except OSError:
+                continue  # root not exists or not readable
+
+            with entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+
+                    path = entry.path
+                    if isfile(f"{path}{sep}suite.yaml"):
+                        is_archived = isfile(f"{path}{sep}{flag_name}")
+                        if archived == is_archived:
+                            yield SavedSuite(
+                                name=entry.name,
+                                branch=b,
+                                path=path,
+                                archived=is_archived,
+                                suite=None,  # lazy load
+                            )
 
 
 class InstalledPackages(object):
@@ -1055,6 +1142,7 @@ class _Suite(Suite):
         s.load_path = None
         s.tools = None
         s.tool_conflicts = None
+        s._ctx_data_cache = None
         s.contexts = d["contexts"]
         if s.contexts:
             s.next_priority = max(x["priority"]
@@ -1093,6 +1181,7 @@ class SweetSuite(_Suite):
         super(SweetSuite, self).__init__()
         self._description = ""
         self._is_live = True
+        self._ctx_data_cache = None
 
     def context(self, name):
         """Get a context.
@@ -1328,22 +1417,45 @@ class SweetSuite(_Suite):
         """Re-resolve all contexts that loaded from .rxt files
         :return:
         """
-        for name in list(self.contexts.keys()):
-            context = self.context(name)
-            if context.load_path:
-                self.update_context(
-                    name,
-                    re_resolve_rxt(context, package_paths=package_paths),
-                )
+        rxt_contexts = {
+            name: context
+            for name, context in (
+                (n, self.context(n)) for n in list(self.contexts.keys())
+            )
+            if context.load_path
+        }
+        if not rxt_contexts:
+            return
+
+        # resolves are mostly package repository I/O, so re-resolving in
+        # threads still overlaps nicely even under the GIL.
+        def _re_resolve(context):
+            return re_resolve_rxt(context, package_paths=package_paths)
+
+        with ThreadPoolExecutor() as executor:
+            resolved = list(executor.map(_re_resolve, rxt_contexts.values()))
+
+        for name, context in zip(rxt_contexts.keys(), resolved):
+            self.update_context(name, context)
+
+    def _flush_tools(self):
+        super(SweetSuite, self)._flush_tools()
+        self._ctx_data_cache = None
+
+    def _sorted_contexts(self):
+        # every priority mutation flushes tools, so the sorted order can
+        # be kept until next flush.
+        if self._ctx_data_cache is None:
+            self._ctx_data_cache = \
+                sorted(self.contexts.values(), key=_priority_key)
+        return self._ctx_data_cache
 
     def _update_tools(self, suppress_err=False):
-        report_err = self.tools is None  # only after tools were flushed
+        if self.tools is not None:
+            return  # tools not flushed since last update, cache still valid
 
         super(SweetSuite, self)._update_tools()
 
-        if not report_err:
-            return
-
         err = None
         for data in self.contexts.values():
             context = data.get("context")  # type: RollingContext
@@ -1368,7 +1480,8 @@ class SweetSuite(_Suite):
 
     # Exposing protected member that I'd like to use.
     update_tools = _update_tools
-    flush_tools = Suite._flush_tools
+    flush_tools = _flush_tools
+    sorted_contexts = _sorted_contexts
 
 
 class _BrokenResolver(object):
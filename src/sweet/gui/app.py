@@ -122,6 +122,8 @@ class Session(object):
         ctrl.suite_saved.connect(storage_model.add_one_saved_suite)
 
         # control -> view
+        ctrl.pkg_scan_started.connect(installed_pkg.on_scan_started)
+        ctrl.pkg_scan_ended.connect(installed_pkg.on_scan_ended)
         ctrl.storage_scan_started.connect(storage_suite.on_refreshed)
         ctrl.suite_newed.connect(stacked_request.on_suite_newed)
         ctrl.suite_newed.connect(stacked_resolve.on_suite_newed)
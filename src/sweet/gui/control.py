@@ -16,6 +16,7 @@ from ..core import (
     SavedSuite,
     PkgFamily,
     PkgVersion,
+    batch_warnings,
     re_resolve_rxt,
 )
 from ._vendor.Qt5 import QtCore, QtWidgets
@@ -330,14 +331,17 @@ class Controller(QtCore.QObject):
     def toggle_context(self, name, check_state, order):
         if check_state:
             data = self._disabled.pop(name)
-            self._sop.add_context(name, data["context"])
-            self._sop.update_context(
-                name, prefix=data["prefix"], suffix=data["suffix"],
-            )
-            for _name, alias in (data["tool_aliases"] or {}).items():
-                self._sop.update_context(name, tool_name=name, new_alias=alias)
-            for _name in data["hidden_tools"] or []:
-                self._sop.update_context(name, tool_name=name, set_hidden=True)
+            with batch_warnings():
+                self._sop.add_context(name, data["context"])
+                self._sop.update_context(
+                    name, prefix=data["prefix"], suffix=data["suffix"],
+                )
+                for _name, alias in (data["tool_aliases"] or {}).items():
+                    self._sop.update_context(
+                        name, tool_name=name, new_alias=alias)
+                for _name in data["hidden_tools"] or []:
+                    self._sop.update_context(
+                        name, tool_name=name, set_hidden=True)
             self._sop.reorder_contexts(order)
         else:
             self._disabled[name] = self._sop.get_context_data(name)
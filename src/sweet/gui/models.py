@@ -1,5 +1,6 @@
 
 import os
+import json
 import logging
 from datetime import datetime
 from itertools import zip_longest
@@ -86,6 +87,20 @@ class JsonModel(qjsonmodel.QJsonModel):
     def __init__(self, parent=None):
         super(JsonModel, self).__init__(parent)
         self._headers = ("Key", "Value/[Count]")
+        self._json_text = None
+
+    def load(self, document):
+        self._json_text = None
+        return super(JsonModel, self).load(document)
+
+    def json_text(self):
+        """Full model serialized as pretty-printed JSON, memoized per load"""
+        if self._json_text is None:
+            self._json_text = json.dumps(self.json(),
+                                         indent=4,
+                                         sort_keys=True,
+                                         ensure_ascii=False)
+        return self._json_text
 
     def setData(self, index, value, role):
         # Support copy/paste, but prevent edits
@@ -680,6 +695,7 @@ class ResolvedEnvironmentModel(JsonModel):
         :param inspection:
         :type inspection: list[tuple[Variant or str or None, str, str]]
         """
+        self._inspected.clear()
         for scope, key, value in inspection:
             if self._is_path_list(str(value)):
                 for path in value.split(os.pathsep):
@@ -757,6 +773,14 @@ class ResolvedEnvironmentModel(JsonModel):
         return base_flags
 
 
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()\\")
+
+
+def _is_plain_text(text):
+    """Whether `text` is free of regex metacharacters"""
+    return not _REGEX_METACHARS.intersection(text)
+
+
 class ResolvedEnvironmentProxyModel(QtCore.QSortFilterProxyModel):
 
     def __init__(self, *args, **kwargs):
@@ -765,26 +789,72 @@ class ResolvedEnvironmentProxyModel(QtCore.QSortFilterProxyModel):
         self.setSortCaseSensitivity(QtCore.Qt.CaseInsensitive)
         self.setRecursiveFilteringEnabled(True)
         self._inverse = False
+        self._filter_text = ""
+        self._accepted = set()  # type: set[tuple[int, int]]
+        self._last_accepted = None  # type: set[tuple[int, int]] or None
+
+    def setSourceModel(self, model):
+        super(ResolvedEnvironmentProxyModel, self).setSourceModel(model)
+        model.modelAboutToBeReset.connect(self._drop_filter_cache)
+        # cached row keys die with the items they point to
+
+    def _drop_filter_cache(self):
+        self._accepted = set()
+        self._last_accepted = None
+
+    def setFilterRegExp(self, pattern):
+        text = pattern.pattern() \
+            if isinstance(pattern, QtCore.QRegExp) else str(pattern)
+        self._note_filter_change(text)
+        super(ResolvedEnvironmentProxyModel, self).setFilterRegExp(pattern)
+
+    def setFilterFixedString(self, text):
+        self._note_filter_change(text)
+        super(ResolvedEnvironmentProxyModel, self).setFilterFixedString(text)
+
+    def _note_filter_change(self, text):
+        # When the new filter only extends the previous one with plain
+        # characters, its matches must be a subset of the previous pass —
+        # rows rejected last time can be rejected again without re-running
+        # the regex. Inverse mode grows the result set, so no reuse there.
+        reusable = (
+            self._filter_text
+            and text.startswith(self._filter_text)
+            and not self._inverse
+            and _is_plain_text(text)
+        )
+        self._last_accepted = self._accepted if reusable else None
+        self._filter_text = text
+        self._accepted = set()
 
     def filter_by_key(self):
         self.setFilterRole(JsonModel.KeyRole)
+        self._drop_filter_cache()
         self.invalidateFilter()
 
     def filter_by_value(self):
         self.setFilterRole(JsonModel.ValueRole)
+        self._drop_filter_cache()
         self.invalidateFilter()
 
     def inverse_filter(self, value):
         self._inverse = bool(value)
+        self._drop_filter_cache()
         self.invalidateFilter()
 
     def filterAcceptsRow(self,
                          source_row: int,
                          source_parent: QtCore.QModelIndex) -> bool:
+        key = (source_parent.internalId(), source_row)
+        last = self._last_accepted
+        if last is not None and key not in last:
+            return False
         accept = super(ResolvedEnvironmentProxyModel,
                        self).filterAcceptsRow(source_row, source_parent)
         if self._inverse:
-            return not accept
+            accept = not accept
+        if accept:
+            self._accepted.add(key)
         return accept
 
 
@@ -1117,7 +1187,7 @@ class InstalledPackagesModel(BaseItemModel, metaclass=QSingleton):
 
                 family.appendRow([name_item, date_item])
 
-        latest = next(iter(sorted(_times, reverse=True)), -1)
+        latest = max(_times, default=-1)
         if latest >= 0:
             date_item = self.itemFromIndex(self.index(family.row(), 1))
             date_item.setData(latest, QtCore.Qt.DisplayRole)
@@ -1,7 +1,7 @@
 
-import re
-import json
+import sys
 import logging
+import functools
 import traceback
 from io import StringIO
 from datetime import datetime
@@ -36,20 +36,101 @@ from .models import (
 log = logging.getLogger("sweet")
 
 
+_BLOCKED_EVENTS = frozenset({
+    QtCore.QEvent.Scroll,
+    QtCore.QEvent.KeyPress,
+    QtCore.QEvent.KeyRelease,
+    QtCore.QEvent.MouseButtonPress,
+    QtCore.QEvent.MouseButtonRelease,
+    QtCore.QEvent.MouseButtonDblClick,
+})
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()\\")
+
+
+@functools.lru_cache(maxsize=64)
+def _filter_regexp(text):
+    """Compiled case-insensitive filter pattern, kept across keystrokes
+
+    Passing raw text to `setFilterRegExp` makes Qt re-parse the pattern on
+    every debounced search; deleting and retyping hits the same patterns
+    over and over.
+
+    :param str text:
+    :rtype: QtCore.QRegExp
+    """
+    return QtCore.QRegExp(text, QtCore.Qt.CaseInsensitive)
+
+
+_icon_cache = {}  # type: dict[str, QtGui.QIcon]
+
+
+def _icon(resource):
+    """Shared QIcon per resource path, parses each SVG once per process
+    :param str resource:
+    :rtype: QtGui.QIcon
+    """
+    icon = _icon_cache.get(resource)
+    if icon is None:
+        icon = _icon_cache[resource] = QtGui.QIcon(resource)
+    return icon
+
+
+class _Runnable(QtCore.QRunnable):
+    """Minimal callable wrapper for QThreadPool"""
+
+    def __init__(self, fn):
+        super(_Runnable, self).__init__()
+        self._fn = fn
+
+    def run(self):
+        self._fn()
+
+
+_print_pool = None  # type: QtCore.QThreadPool or None
+
+
+def _context_print_pool():
+    """Single-thread pool for context info printing jobs
+
+    These jobs patch `rez.resolved_context.Printer` module-wide while they
+    run (see `HtmlPrinter.patch_context_printer`), so they must never
+    overlap: interleaved patch/restore would leave some prints un-styled
+    and could leave the module permanently patched.
+
+    :rtype: QtCore.QThreadPool
+    """
+    global _print_pool
+    if _print_pool is None:
+        _print_pool = QtCore.QThreadPool()
+        _print_pool.setMaxThreadCount(1)
+    return _print_pool
+
+
 class BusyEventFilterSingleton(QtCore.QObject, metaclass=QSingleton):
     overwhelmed = QtCore.Signal(str, int)
 
+    def __init__(self, *args, **kwargs):
+        super(BusyEventFilterSingleton, self).__init__(*args, **kwargs)
+        self._busy_roots = set()
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.installEventFilter(self)
+
+    def add_root(self, widget):
+        self._busy_roots.add(widget)
+
+    def remove_root(self, widget):
+        self._busy_roots.discard(widget)
+
     def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if event.type() in (
-            QtCore.QEvent.Scroll,
-            QtCore.QEvent.KeyPress,
-            QtCore.QEvent.KeyRelease,
-            QtCore.QEvent.MouseButtonPress,
-            QtCore.QEvent.MouseButtonRelease,
-            QtCore.QEvent.MouseButtonDblClick,
-        ):
-            self.overwhelmed.emit("Not allowed at this moment.", 5000)
-            return True
+        if not self._busy_roots:
+            return False
+        if event.type() in _BLOCKED_EVENTS and watched.isWidgetType():
+            for root in self._busy_roots:
+                if root is watched or root.isAncestorOf(watched):
+                    self.overwhelmed.emit("Not allowed at this moment.", 5000)
+                    return True
         return False
 
 
@@ -66,6 +147,7 @@ class BusyWidget(QtWidgets.QWidget):
         super(BusyWidget, self).__init__(*args, **kwargs)
         self._busy_works = set()
         self._entered = False
+        self._blocked = False
         self._filter = BusyEventFilterSingleton(self)
         self._instances.append(self)
 
@@ -110,23 +192,32 @@ class BusyWidget(QtWidgets.QWidget):
         else:
             QtWidgets.QApplication.restoreOverrideCursor()
 
-    def _block_children(self, block):
-
-        def action(w):
-            if block:
-                w.installEventFilter(self._filter)
-            else:
-                w.removeEventFilter(self._filter)
+    def showEvent(self, event):
+        super(BusyWidget, self).showEvent(event)
+        self._sync_filter_root()
 
-        def iter_children(w):
-            for c in w.children():
-                yield c
-                for gc in iter_children(c):
-                    yield gc
+    def hideEvent(self, event):
+        super(BusyWidget, self).hideEvent(event)
+        self._filter.remove_root(self)
 
-        for child in list(iter_children(self)):
-            action(child)
-        action(self)
+    def _block_children(self, block):
+        # note: The filter is installed once on the application, so marking
+        #   this widget as a busy root is all it takes to block the whole
+        #   subtree. No per-descendant filter install/remove needed.
+        if block == self._blocked:
+            return
+        self._blocked = block
+        self._sync_filter_root()
+
+    def _sync_filter_root(self):
+        # A hidden widget (e.g. an inactive stacked panel) receives no input
+        # to block, so keep it out of the busy-root set and spare the
+        # app-wide filter one ancestor check per event. showEvent puts it
+        # back if it re-appears while still busy.
+        if self._blocked and self.isVisible():
+            self._filter.add_root(self)
+        else:
+            self._filter.remove_root(self)
 
 
 class TreeView(qoverview.VerticalExtendedTreeView):
@@ -145,14 +236,7 @@ class JsonView(TreeView):
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.on_right_click)
 
-    def on_right_click(self, position):
-        index = self.indexAt(position)
-
-        if not index.isValid():
-            # Clicked outside any item
-            return
-
-        model_ = index.model()
+        # build the menu once, re-aim it per click
         menu = QtWidgets.QMenu(self)
         copy = QtWidgets.QAction("Copy JSON", menu)
         copy_full = QtWidgets.QAction("Copy full JSON", menu)
@@ -161,30 +245,35 @@ class JsonView(TreeView):
         menu.addAction(copy_full)
         menu.addSeparator()
 
-        def on_copy():
-            text = str(model_.data(index, JsonModel.JsonRole))
-            app = QtWidgets.QApplication.instance()
-            app.clipboard().setText(text)
+        copy.triggered.connect(self._on_copy)
+        copy_full.triggered.connect(self._on_copy_full)
 
-        def on_copy_full():
-            if isinstance(model_, QtCore.QSortFilterProxyModel):
-                data = model_.sourceModel().json()
-            else:
-                data = model_.json()
+        self._menu = menu
+        self._menu_index = None
 
-            text = json.dumps(data,
-                              indent=4,
-                              sort_keys=True,
-                              ensure_ascii=False)
+    def on_right_click(self, position):
+        index = self.indexAt(position)
 
-            app = QtWidgets.QApplication.instance()
-            app.clipboard().setText(text)
+        if not index.isValid():
+            # Clicked outside any item
+            return
 
-        copy.triggered.connect(on_copy)
-        copy_full.triggered.connect(on_copy_full)
+        self._menu_index = index
+        self._menu.popup(QtGui.QCursor.pos())
 
-        menu.move(QtGui.QCursor.pos())
-        menu.show()
+    def _on_copy(self):
+        index = self._menu_index
+        text = str(index.model().data(index, JsonModel.JsonRole))
+        app = QtWidgets.QApplication.instance()
+        app.clipboard().setText(text)
+
+    def _on_copy_full(self):
+        model_ = self._menu_index.model()
+        if isinstance(model_, QtCore.QSortFilterProxyModel):
+            model_ = model_.sourceModel()
+
+        app = QtWidgets.QApplication.instance()
+        app.clipboard().setText(model_.json_text())
 
 
 class ComboBox(QtWidgets.QComboBox):
@@ -384,6 +473,9 @@ class ContextList(QtWidgets.QListWidget):
         super(ContextList, self).__init__(*args, **kwargs)
         self.setSortingEnabled(False)  # do not sort this !
         self.setSelectionMode(self.SingleSelection)
+        self.setUniformItemSizes(True)  # rows are all one-liners, let the
+        # view compute layout from a single size hint instead of probing
+        # every item.
 
     def mouseReleaseEvent(self, event):
         # type: (QtGui.QMouseEvent) -> None
@@ -456,8 +548,9 @@ class ContextListWidget(QtWidgets.QWidget):
         view.itemClicked.connect(self._on_item_clicked)
 
         self._view = view
-        self._icon_ctx = QtGui.QIcon(":/icons/layers-half.svg")
-        self._icon_ctx_f = QtGui.QIcon(":/icons/exclamation-triangle-fill.svg")
+        self._items = {}  # type: dict[str, QtWidgets.QListWidgetItem]
+        self._icon_ctx = _icon(":/icons/layers-half.svg")
+        self._icon_ctx_f = _icon(":/icons/exclamation-triangle-fill.svg")
 
     def _on_item_clicked(self, item: QtWidgets.QListWidgetItem):
         # note: we can't count on itemChanged signal for checkState change
@@ -495,11 +588,12 @@ class ContextListWidget(QtWidgets.QWidget):
         item.setIcon(self._icon_ctx)
         item.setCheckState(QtCore.Qt.Checked)
         item.setData(self.ContextCheckedRole, QtCore.Qt.Checked)
+        self._items[ctx.name] = item
         self._view.insertItem(0, item)
         self._view.setCurrentRow(0)
 
     def on_context_dropped(self, name):
-        item = self._find_item(name)
+        item = self._items.pop(name, None)
         assert item is not None, f"{name!r} not exists, this is a bug."
         self._view.takeItem(self._view.row(item))
         self._view.removeItemWidget(item)
@@ -510,42 +604,52 @@ class ContextListWidget(QtWidgets.QWidget):
         item.setData(self.ContextCheckedRole, check_state)
 
     def on_context_reordered(self, new_order):
-        dragged = self._view.currentItem().text()
+        view = self._view
+        dragged = view.currentItem().text()
         dropped_in = new_order.index(dragged)
 
-        items = []
-        for name in new_order:
-            item = self._find_item(name)
-            if item is None:  # may happen when the item being dragged is the
-                continue      # only item in list.
-            self._view.takeItem(self._view.row(item))
-            items.append(item)
-
-        for item in items:
-            self._view.addItem(item)
-
-        if items:
-            last = items[-1]
-            last.setFont(QtGui.QFont("Open Sans", last.font().pointSize()))
-            # this is a fix for item being dragged out and lost it's font
-            #   family after append back to view. (both PyQt5 and PySide2)
-
-        self._view.setCurrentRow(dropped_in)
+        # suppress per-item repaints/signals, one update at the end
+        view.setUpdatesEnabled(False)
+        view.blockSignals(True)
+        try:
+            items = []
+            for name in new_order:
+                item = self._find_item(name)
+                if item is None:  # may happen when the item being dragged is
+                    continue      # the only item in list.
+                view.takeItem(view.row(item))
+                items.append(item)
+
+            for item in items:
+                view.addItem(item)
+
+            if items:
+                last = items[-1]
+                last.setFont(QtGui.QFont("Open Sans", last.font().pointSize()))
+                # this is a fix for item being dragged out and lost it's font
+                #   family after append back to view. (both PyQt5 and PySide2)
+        finally:
+            view.blockSignals(False)
+            view.setUpdatesEnabled(True)
+            view.viewport().update()
+
+        view.setCurrentRow(dropped_in)
 
     def on_context_renamed(self, name, new_name):
-        item = self._find_item(name)
+        item = self._items.pop(name, None)
         assert item is not None, f"{name!r} not exists, this is a bug."
+        self._items[new_name] = item
         item.setText(new_name)
 
     def on_suite_newed(self):
+        self._items.clear()
         self._view.clear()
 
     def _find_item(self, name) -> QtWidgets.QListWidgetItem:
-        match_flags = QtCore.Qt.MatchExactly
-        return next(iter(self._view.findItems(name, match_flags)), None)
+        return self._items.get(name)
 
     def add_context(self):
-        existing = self.context_names()
+        existing = self._items.keys()
         widget = ValidNameEditWidget(placeholder="Input context name..",
                                      blacklist=existing,
                                      blacked_msg="Duplicated Name.")
@@ -567,8 +671,7 @@ class ContextListWidget(QtWidgets.QWidget):
         :return:
         """
         old_name = item.text()
-        existing = self.context_names()
-        existing.remove(old_name)
+        existing = self._items.keys() - {old_name}
 
         widget = ValidNameEditWidget(placeholder=f"old-name: {old_name}",
                                      blacklist=existing,
@@ -598,13 +701,18 @@ class ContextListWidget(QtWidgets.QWidget):
         ]
 
     def context_names(self, enabled=None):
+        # note: Names must come off the view, not `self._items` — internal
+        #   drag-drop reorders rows without any chance to re-sync the dict.
         checked_role = self.ContextCheckedRole
-        return [
-            self._view.item(row).text()
-            for row in range(self._view.count())
-            if enabled is None
-            or bool(self._view.item(row).data(checked_role)) is enabled
-        ]
+        item = self._view.item
+        if enabled is None:
+            return [item(row).text() for row in range(self._view.count())]
+        names = []
+        for row in range(self._view.count()):
+            it = item(row)
+            if bool(it.data(checked_role)) is enabled:
+                names.append(it.text())
+        return names
 
     def context_reordered(self):
         new_order = self.context_names()
@@ -615,15 +723,16 @@ class ValidNameLineEdit(QtWidgets.QLineEdit):
     blacked = QtCore.Signal()
     prompted = QtCore.Signal(str)
     validated = QtCore.Signal(bool)
+    _name_regexp = QtCore.QRegExp("^[a-zA-Z0-9_.-]*$")  # shared, compile once
 
     def __init__(self, blacklist=None, default="", blank_ok=False,
                  *args, **kwargs):
         super(ValidNameLineEdit, self).__init__(*args, **kwargs)
 
         interval = 1000
-        blacklist = blacklist or []
+        blacklist = frozenset(blacklist or ())  # O(1) lookup per keystroke
 
-        validator = RegExpValidator("^[a-zA-Z0-9_.-]*$")
+        validator = RegExpValidator(self._name_regexp)
         self.setText(default)
         self.setValidator(validator)
         self.setToolTip("Only alphanumeric characters A-Z, a-z, 0-9 and "
@@ -633,27 +742,25 @@ class ValidNameLineEdit(QtWidgets.QLineEdit):
         timer.setSingleShot(True)
         timer.setInterval(interval)
 
-        anim = QtCore.QPropertyAnimation()
-        anim.setEasingCurve(QtCore.QEasingCurve.InCubic)
-        anim.setDuration(interval)
+        debounce = QtCore.QTimer(self)
+        debounce.setSingleShot(True)
+        debounce.setInterval(40)
+        # coalesce rapid keystrokes so only the settled text gets the full
+        # blacklist check + hint treatment.
 
-        anim.finished.connect(self._on_anim_finished)
-        timer.timeout.connect(lambda: self.prompted.emit(""))
+        timer.timeout.connect(self._on_hint_expired)
+        debounce.timeout.connect(self._on_changed_check_blacklist)
         validator.validated.connect(self._on_validator_validated)
-        self.textChanged.connect(self._on_changed_check_blacklist)
+        self.textChanged.connect(lambda _: debounce.start())
 
-        self._anim = anim
         self._timer = timer
-        self._color = None
-        self._interval = interval
+        self._debounce = debounce
+        self._invalid = None  # None means border not yet overridden
         self._default = default
         self._blacklist = blacklist
         self._blank_ok = blank_ok
         self.__block = False
 
-        anim.setTargetObject(self)
-        anim.setPropertyName(QtCore.QByteArray(b"_qproperty_color"))
-
     def validate_default(self):
         """Emit validated signal with default value, call this on open"""
         self.validated.emit(bool(self._default) or self._blank_ok)
@@ -661,55 +768,57 @@ class ValidNameLineEdit(QtWidgets.QLineEdit):
     def _on_validator_validated(self, state):
         if state == QtGui.QValidator.Invalid:
             self.prompted.emit("Invalid char.")
-            self._anim.stop()
-            self._setup_anim_colors()
-            self._anim.start()
+            self._set_border(invalid=True)
             self._timer.start()
 
-    def _on_anim_finished(self):
-        self._blacked_hint(self.text() in self._blacklist)
+    def _on_hint_expired(self):
+        self.prompted.emit("")
+        self._set_border(invalid=self.text() in self._blacklist)
 
-    def _on_changed_check_blacklist(self, value):
+    def _on_changed_check_blacklist(self):
+        value = self.text()
         is_blacked = value in self._blacklist
         self._blacked_hint(is_blacked)
         self.validated.emit(not is_blacked and (bool(value) or self._blank_ok))
 
     def _blacked_hint(self, show):
-        self._setup_anim_colors()
-        self._anim.start()
-        self._anim.pause()
         if show:
             self.blacked.emit()
-            self._anim.setCurrentTime(0)
+            self._set_border(invalid=True)
         else:
             self.prompted.emit("")
-            self._anim.setCurrentTime(self._interval - 1)
-            # finished signal emitted when the current time equals to
-            # totalDuration (interval).
+            self._set_border(invalid=False)
 
-    def _setup_anim_colors(self):
-        theme = res.current_theme()
-        color_invalid = theme.palette.error.q_color()
-        color_ready = theme.palette.border.q_color()
-        self._anim.setStartValue(color_invalid)
-        self._anim.setEndValue(color_ready)
-        self._color = color_ready
-
-    def _get_color(self):
-        return self._color or QtGui.QColor()
+    _hint_color_cache = {}  # shared across instances, keyed by theme
 
-    def _set_color(self, color):
-        self._color = color
+    def _hint_colors(self):
+        theme = res.current_theme()
+        key = (theme.name, theme.dark)
+        colors = self._hint_color_cache.get(key)
+        if colors is None:
+            colors = (theme.palette.error.q_color(),
+                      theme.palette.border.q_color())
+            self._hint_color_cache[key] = colors
+        return colors
+
+    def _set_border(self, invalid, force=False):
+        # two-state swap: setStyleSheet re-parses CSS and re-polishes the
+        # widget, so only touch it when the state actually flips.
+        if invalid == self._invalid and not force:
+            return
+        self._invalid = invalid
+        color_invalid, color_ready = self._hint_colors()
+        color = color_invalid if invalid else color_ready
         self.setStyleSheet("border-color: %s;" % color.name())
 
-    _qproperty_color = QtCore.Property(QtGui.QColor, _get_color, _set_color)
-
     def changeEvent(self, event):
         super(ValidNameLineEdit, self).changeEvent(event)
         if not self.__block and event.type() == QtCore.QEvent.StyleChange:
             # update color when theme changed (blockSignals not working here)
             self.__block = True
-            self._setup_anim_colors()
+            self._hint_color_cache.clear()
+            if self._invalid is not None:
+                self._set_border(self._invalid, force=True)
             self.__block = False
 
 
@@ -760,9 +869,12 @@ class ValidNameEditWidget(QtWidgets.QWidget):
 class RegExpValidator(QtGui.QRegExpValidator):
     validated = QtCore.Signal(QtGui.QValidator.State)
 
-    def __init__(self, pattern):
-        super(RegExpValidator, self).__init__(QtCore.QRegExp(pattern))
-        self._pattern = re.compile(pattern)
+    def __init__(self, regexp):
+        """
+        :param regexp: A compiled regular expression
+        :type regexp: QtCore.QRegExp
+        """
+        super(RegExpValidator, self).__init__(regexp)
 
     def validate(self, text, pos):
         state, t, c = super(RegExpValidator, self).validate(text, pos)
@@ -775,6 +887,11 @@ class ToolsView(TreeView):
     def __init__(self, *args, **kwargs):
         super(ToolsView, self).__init__(*args, **kwargs)
         self.setObjectName("ToolsView")
+        self.setUniformRowHeights(True)  # all rows are single-line text,
+        # so layout can derive heights from one hint instead of probing
+        # the size of each row on every paint.
+        self.setAnimated(False)
+        self.setVerticalScrollMode(self.ScrollPerPixel)
         self.activated.connect(self._on_item_activated)
 
     def _on_item_activated(self, index):
@@ -869,9 +986,17 @@ class NameStackedBase(QtWidgets.QStackedWidget):
     def __init__(self, *args, **kwargs):
         super(NameStackedBase, self).__init__(*args, **kwargs)
         self._names = []
+        self._indexes = {}  # type: dict[str, int]
         self._callbacks = []  # type: list[dict["op_name", "callback"]]
         self._add_panel_0()
 
+    def _reindex(self, start=0):
+        """Re-sync name -> stack index lookup after `_names` mutated"""
+        names = self._names
+        indexes = self._indexes
+        for i in range(start, len(names)):
+            indexes[names[i]] = i
+
     def create_panel(self):
         """Re-implement this method for widget creation
         :return: A widget to be stacked
@@ -914,19 +1039,23 @@ class NameStackedBase(QtWidgets.QStackedWidget):
         if is_first:
             panel = self.widget(0)
             panel.setEnabled(True)
-            panel.setStyleSheet(panel.styleSheet())
-            # note:
-            #   Re-applying stylesheet for correcting the color of placeholder
-            #   text in QLineEdit. Somehow the placeholder text gets brighter
-            #   color when the widget is re-enabled, but this only happens on
-            #   MacOS, and only the QLineEdit in the first panel and, when the
-            #   stylesheet is applied. This also happens with PyQt5.
+            if sys.platform == "darwin":
+                panel.setStyleSheet(panel.styleSheet())
+                # note:
+                #   Re-applying stylesheet for correcting the color of
+                #   placeholder text in QLineEdit. Somehow the placeholder
+                #   text gets brighter color when the widget is re-enabled,
+                #   but this only happens on MacOS, and only the QLineEdit in
+                #   the first panel and, when the stylesheet is applied. This
+                #   also happens with PyQt5. Re-applying stylesheet means a
+                #   full CSS re-parse, so other platforms skip it.
         else:
             panel = self.add_panel()
             self.setCurrentIndex(0)
 
         self._names.insert(0, ctx.name)
         self._callbacks.insert(0, getattr(panel, "callbacks", {}))
+        self._reindex()
         self.run_panel_callback(0, op_name, ctx)
 
     @QtCore.Slot(str, core.RollingContext)  # noqa
@@ -940,7 +1069,7 @@ class NameStackedBase(QtWidgets.QStackedWidget):
         :return:
         """
         op_name = ":stashed:"
-        index = self._names.index(name)
+        index = self._indexes[name]
         self.run_panel_callback(index, op_name, context)
 
     @QtCore.Slot(str, core.RollingContext)  # noqa
@@ -954,23 +1083,24 @@ class NameStackedBase(QtWidgets.QStackedWidget):
         :return:
         """
         op_name = ":resolved:"
-        index = self._names.index(name)
+        index = self._indexes[name]
         self.run_panel_callback(index, op_name, context)
 
     @QtCore.Slot(str, str)  # noqa
     def on_context_renamed(self, name, new_name):
         op_name = ":renamed:"
-        index = self._names.index(name)
+        index = self._indexes.pop(name)
         self.run_panel_callback(index, op_name, new_name)
 
-        self._names.remove(name)
-        self._names.insert(index, new_name)
+        self._names[index] = new_name
+        self._indexes[new_name] = index
 
     @QtCore.Slot(str)  # noqa
     def on_context_dropped(self, name):
-        index = self._names.index(name)
+        index = self._indexes.pop(name)
         self._callbacks.pop(index)
-        self._names.remove(name)
+        self._names.pop(index)
+        self._reindex(index)
         is_empty = len(self._names) == 0
 
         panel = self.widget(index)
@@ -984,21 +1114,28 @@ class NameStackedBase(QtWidgets.QStackedWidget):
     @QtCore.Slot(str, int)  # noqa
     def on_context_toggled(self, name, check_state):
         op_name = ":toggled:"
-        index = self._names.index(name)
+        index = self._indexes[name]
         self.run_panel_callback(index, op_name, check_state)
 
     @QtCore.Slot(str)  # noqa
     def on_context_selected(self, name):
         # name may not exists yet while the context is just being added.
-        if name in self._names:
-            self.setCurrentIndex(self._names.index(name))
+        index = self._indexes.get(name)
+        if index is not None:
+            self.setCurrentIndex(index)
 
     @QtCore.Slot()  # noqa
     def on_suite_newed(self):
         self._callbacks.clear()
-        for i in range(self.count()):
-            self.removeWidget(self.widget(0))
         self._names.clear()
+        self._indexes.clear()
+        # batch the teardown so N panel removals cost one layout pass
+        self.setUpdatesEnabled(False)
+        widgets = [self.widget(i) for i in range(self.count())]
+        for w in widgets:
+            self.removeWidget(w)
+            w.deleteLater()
+        self.setUpdatesEnabled(True)
         self._add_panel_0()
 
 
@@ -1124,15 +1261,22 @@ class RequestTableEdit(QtWidgets.QTableWidget):
                 self.removeRow(row)
 
     def replace_requests(self, requests):
-        self.remove_all_rows()
+        # batch the rebuild: one row-count change and no per-item
+        # itemChanged storm, then a single edited notification.
+        self.blockSignals(True)
+        self.setUpdatesEnabled(False)
+        self.setRowCount(0)
+        self.setRowCount(len(requests) + 1)
 
         for row, text in enumerate(requests):
-            self.insertRow(row)
             self.setItem(row, 0, QtWidgets.QTableWidgetItem(text))
 
-        row = self.rowCount()
-        self.insertRow(row)
+        row = len(requests)
         self.setItem(row, 0, QtWidgets.QTableWidgetItem())
+        self.setUpdatesEnabled(True)
+        self.blockSignals(False)
+
+        self.edited.emit()
         self.open_editor(row)
 
     def fetch_requests(self):
@@ -1162,8 +1306,6 @@ class RequestTableEdit(QtWidgets.QTableWidget):
 
     def remove_all_rows(self):
         self.clearContents()
-        for _ in range(self.rowCount()):
-            self.removeRow(0)
         self.setRowCount(0)
 
 
@@ -1183,7 +1325,26 @@ class RequestTextEdit(QtWidgets.QTextEdit):
         completer = RequestCompleter(self)
         self.setCompleter(completer)
 
-        self.textChanged.connect(self.edited.emit)
+        debounce = QtCore.QTimer(self)
+        debounce.setSingleShot(True)
+        debounce.setInterval(200)
+        # forward one edited per typing burst, not one per keystroke
+        debounce.timeout.connect(self.edited.emit)
+        self.textChanged.connect(self._on_text_changed)
+        self._debounce = debounce
+        self._requests_cache = None  # type: list[str] or None
+
+    def _on_text_changed(self):
+        self._requests_cache = None
+        self._debounce.start()
+
+    def requests(self):
+        """Current request list, document walked at most once per edit
+        :rtype: list[str]
+        """
+        if self._requests_cache is None:
+            self._requests_cache = self.toPlainText().split()
+        return self._requests_cache
 
     def setCompleter(self, c):
         """
@@ -1346,11 +1507,13 @@ class RequestEditorWidget(QtWidgets.QWidget):
         self._table = table_editor
         self._timer = timer
         self._processed = None
+        self._processed_hash = hash(())
+        self._last_emitted = None  # type: bool or None
 
     def on_tab_changed(self, index):
         if index == 0:
             # text -> table
-            requests = self._text.toPlainText().split()
+            requests = self._text.requests()
             self._table.replace_requests(requests)
         elif index == 1:
             # table -> text
@@ -1362,7 +1525,17 @@ class RequestEditorWidget(QtWidgets.QWidget):
         self._timer.start(450)
 
     def _deferred_edited(self):
-        edited = (self._processed or []) != self.get_requests()
+        current = self.get_requests()
+        if hash(tuple(current)) != self._processed_hash:
+            edited = True
+        else:
+            # hashes agree, verify (collisions are possible, equality isn't
+            # worth assuming)
+            edited = (self._processed or []) != current
+
+        if edited == self._last_emitted:
+            return  # nothing changed since last emit, spare the consumers
+        self._last_emitted = edited
         self.edited.emit(edited)
 
     def set_requests(self, requests):
@@ -1377,13 +1550,15 @@ class RequestEditorWidget(QtWidgets.QWidget):
         if index == 0:
             return self._table.fetch_requests()
         elif index == 1:
-            return self._text.toPlainText().split()
+            return self._text.requests()
 
     def log_processed(self, requests):
         """
         :param list[str] requests:
         """
         self._processed = requests
+        self._processed_hash = hash(tuple(requests))
+        self._last_emitted = False
         self.edited.emit(False)
 
 
@@ -1480,6 +1655,7 @@ class ContextRequestWidget(QtWidgets.QWidget):
 class ContextResolveWidget(QtWidgets.QWidget):
     env_hovered = QtCore.Signal(str, int)
     stash_clicked = QtCore.Signal()
+    log_ready = QtCore.Signal(str)  # marshals worker output to GUI thread
 
     def __init__(self, *args, **kwargs):
         super(ContextResolveWidget, self).__init__(*args, **kwargs)
@@ -1553,12 +1729,14 @@ class ContextResolveWidget(QtWidgets.QWidget):
 
         tabs.currentChanged.connect(stack.setCurrentIndex)
         environ.hovered.connect(self.env_hovered.emit)
+        self.log_ready.connect(log_.append_log)
         solve_push.clicked.connect(self._on_stash_solve_clicked)
         stash_menu.clicked.connect(self._on_stash_menu_clicked)
         diff_stash.toggled.connect(self._on_diff_toggled)
 
         self._name = None
         self._tabs = tabs
+        self._stack = stack
         self._tools = tools
         self._packages = packages
         self._environ = environ
@@ -1569,11 +1747,13 @@ class ContextResolveWidget(QtWidgets.QWidget):
 
         self._solve_line = solve_line
         self._stash_line = stash_line
+        self._stash_btn = stash_menu
+        self._stash_menu = None  # type: QtWidgets.QMenu or None
         self._stashes = []  # type: list[core.RollingContext]
         self._staged = None  # type: core.RollingContext or None
 
-        self._icon_re = QtGui.QIcon(":/icons/lightning-fill-mono.svg")
-        self._icon_rx = QtGui.QIcon(":/icons/file-earmark-code-fill.svg")
+        self._icon_re = _icon(":/icons/lightning-fill-mono.svg")
+        self._icon_rx = _icon(":/icons/file-earmark-code-fill.svg")
 
         # will be called by StackedResolveWidget
         self.callbacks = {
@@ -1593,22 +1773,34 @@ class ContextResolveWidget(QtWidgets.QWidget):
         if not self._stashes:
             log.warning("Context stash is empty.")
             return
-        menu = QtWidgets.QMenu(self)
+        menu = self._stash_menu
+        if menu is None:
+            menu = self._build_stash_menu()
+
+        # timestamps are relative ("5 minutes ago"), refresh just the
+        # labels on each open — cheap, unlike re-creating menu/actions
         n = len(self._stashes) - 1
+        for i, (a, c) in enumerate(zip(menu.actions(), self._stashes)):
+            a.setText(f"{n - i:02}| {delegates.pretty_timestamp(c.created)}")
+
+        menu.move(QtGui.QCursor.pos())
+        menu.show()
+
+    def _build_stash_menu(self):
+        menu = QtWidgets.QMenu(self)
         for i, c in enumerate(self._stashes):
             icon = self._icon_rx if c.load_path else self._icon_re
-            label = f"{n - i:02}| {delegates.pretty_timestamp(c.created)}"
-            a = QtWidgets.QAction(icon, label, menu)
+            a = QtWidgets.QAction(icon, "", menu)
             a.triggered.connect(lambda chk=False, x=i: self.stage_to_diff(x))
             menu.addAction(a)
 
         def on_hide():
             _btn.style().polish(_btn)  # ensure btn !hover state updated
-        _btn = self.sender()
+        _btn = self._stash_btn
 
         menu.aboutToHide.connect(on_hide)
-        menu.move(QtGui.QCursor.pos())
-        menu.show()
+        self._stash_menu = menu
+        return menu
 
     def _on_diff_toggled(self, on):
         if on and self._staged is None:
@@ -1630,6 +1822,9 @@ class ContextResolveWidget(QtWidgets.QWidget):
             log.warning("A very same context already exists in stash.")
             return
         self._stashes.insert(0, context)
+        if self._stash_menu is not None:
+            self._stash_menu.deleteLater()
+            self._stash_menu = None  # stale, rebuild on next open
         self.stage_to_diff(0)
 
     def stage_to_diff(self, index):
@@ -1655,34 +1850,56 @@ class ContextResolveWidget(QtWidgets.QWidget):
         :param core.RollingContext context:
         """
         self._solve_line.set_timestamp(context.created)
-        self._context.load(context)
-
-        if context.success:
-            # note: maybe we could set `append_sys_path` to false for a bit
-            #   purer environ view.
-            #   context.append_sys_path = False
-            self._packages.model().load(context.resolved_packages)
-            self._environ.model().load(context.get_environ())
-            self._environ.model().note(lib.ContextEnvInspector.inspect(context))
-            self._code.set_shell_code(context.get_shell_code())
-        else:
-            self._packages.model().reset()
-            self._environ.model().clear()
-            self._code.set_shell_code("")
 
+        # several models reset in a row here, keep the tab stack from
+        # repainting once per model
+        self._stack.setUpdatesEnabled(False)
+        try:
+            self._context.load(context)
+
+            if context.success:
+                # note: maybe we could set `append_sys_path` to false for a
+                #   bit purer environ view.
+                #   context.append_sys_path = False
+                self._packages.model().load(context.resolved_packages)
+                self._environ.model().note(
+                    lib.ContextEnvInspector.inspect(context))
+                self._environ.model().load(context.get_environ())
+                self._code.set_shell_code(context.get_shell_code())
+            else:
+                self._packages.model().reset()
+                self._environ.model().clear()
+                self._code.set_shell_code("")
+        finally:
+            self._stack.setUpdatesEnabled(True)
+
+        if not context.success:
             self._tabs.setCurrentIndex(self._tabs.count() - 1)  # Log widget
 
-        with HtmlPrinter.patch_context_printer():
-            stream = StringIO()
-            context.print_info(stream,
-                               verbosity=2,  # noqa, type hint incorrect
-                               source_order=True,
-                               show_resolved_uris=True)
-            stream.seek(0)
+        def print_info_out():
+            # Verbose info of a big resolve takes long enough to stall the
+            # window, and only reads an immutable resolved context — safe to
+            # run off the GUI thread. Result comes back via `log_ready`
+            # (queued connection).
+            with HtmlPrinter.patch_context_printer():
+                stream = StringIO()
+                context.print_info(stream,
+                                   verbosity=2,  # noqa, type hint incorrect
+                                   source_order=True,
+                                   show_resolved_uris=True)
+
             _sep = "=" * 60
-            html = "<br>".join(stream.readlines())
-            html = html.replace("\t", "&nbsp;" * 4)
-            self._log.append_log(f'<p>{_sep}</p><p>{html}</p>')
+            html = stream.getvalue() \
+                .replace("\t", "&nbsp;" * 4) \
+                .replace("\n", "<br>")
+            try:
+                self.log_ready.emit(f'<p>{_sep}</p><p>{html}</p>')
+            except RuntimeError:
+                # panel got deleteLater()-ed (suite new/load) while a big
+                # resolve was still printing; nowhere to show it, drop it
+                pass
+
+        _context_print_pool().start(_Runnable(print_info_out))
 
     def changeEvent(self, event):
         super(ContextResolveWidget, self).changeEvent(event)
@@ -1838,6 +2055,7 @@ class ResolvedEnvironment(QtWidgets.QWidget):
         self._timer = timer
         self._search = search
         self._switch = switch
+        self._last_searched = ""
 
         switch.setCheckState(QtCore.Qt.Checked)
 
@@ -1893,7 +2111,17 @@ class ResolvedEnvironment(QtWidgets.QWidget):
     def _deferred_search(self):
         # https://doc.qt.io/qt-5/qregexp.html#introduction
         text = self._search.text()
-        self._proxy.setFilterRegExp(text)
+        if text == self._last_searched:
+            # e.g. a keystroke typed and undone within the debounce window;
+            # refiltering and expandAll would redo identical work.
+            return
+        self._last_searched = text
+        if _REGEX_METACHARS.intersection(text):
+            self._proxy.setFilterRegExp(text)
+        else:
+            # plain substring, take Qt's fixed-string fast path instead of
+            # evaluating a regex per row
+            self._proxy.setFilterFixedString(text)
         self._view.expandAll() if len(text) > 1 else self._view.collapseAll()
         self._view.reset_extension()
 
@@ -1961,6 +2189,31 @@ class ResolvedContextView(QtWidgets.QWidget):
         self._model.set_placeholder_color(color)
 
 
+class ShellCodeHighlighter(QtGui.QSyntaxHighlighter):
+    """Dims comment lines in shell code, block by block
+
+    Qt only highlights changed/visible blocks, so this replaces building
+    one big HTML string for the entire script on the GUI thread.
+
+    """
+
+    def __init__(self, document):
+        super(ShellCodeHighlighter, self).__init__(document)
+        comment_format = QtGui.QTextCharFormat()
+        comment_format.setForeground(QtGui.QColor("lightgrey"))
+        code_format = QtGui.QTextCharFormat()
+        code_format.setForeground(QtGui.QColor("grey"))
+
+        self._comment = "REM " if system.shell == "cmd" else "# "
+        self._comment_format = comment_format
+        self._code_format = code_format
+
+    def highlightBlock(self, text):
+        is_comment = text.startswith(self._comment)
+        fmt = self._comment_format if is_comment else self._code_format
+        self.setFormat(0, len(text), fmt)
+
+
 class ResolvedCode(QtWidgets.QWidget):
 
     def __init__(self, *args, **kwargs):
@@ -1972,22 +2225,17 @@ class ResolvedCode(QtWidgets.QWidget):
         text.setLineWrapMode(text.NoWrap)
         text.setReadOnly(True)
 
+        highlighter = ShellCodeHighlighter(text.document())
+
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
         layout.addWidget(text)
 
         self._text = text
+        self._highlighter = highlighter
 
     def set_shell_code(self, text):
-        comment = "REM " if system.shell == "cmd" else "# "
-
-        pretty = []
-        for ln in text.split("\n"):
-            level = "lightgrey" if ln.startswith(comment) else "grey"
-            color = "<font color=\"%s\">" % level
-            pretty.append("%s%s</font>" % (color, ln.replace(" ", "&nbsp;")))
-
-        self._text.setText("<br>".join(pretty))
+        self._text.setPlainText(text)
 
 
 class ResolvedGraph(QtWidgets.QWidget):
@@ -2037,25 +2285,26 @@ class VerticalDocTabBar(QtWidgets.QTabBar):
     def paintEvent(self, event):
         painter = QtWidgets.QStylePainter(self)
         opt = QtWidgets.QStyleOptionTab()
+        identity = painter.transform()
 
         for i in range(self.count()):
             self.initStyleOption(opt, i)
             painter.drawControl(QtWidgets.QStyle.CE_TabBarTabShape, opt)
-            painter.save()
 
+            # initStyleOption already set opt.rect to tabRect(i), reuse it
+            c = opt.rect.center()
             s = opt.rect.size()
             s.transpose()
             r = QtCore.QRect(QtCore.QPoint(), s)
-            r.moveCenter(opt.rect.center())
+            r.moveCenter(c)
             opt.rect = r
 
-            rect = self.tabRect(i)
-            c = rect.center()
             painter.translate(c)
             painter.rotate(90)
             painter.translate(-c)
             painter.drawControl(QtWidgets.QStyle.CE_TabBarTabLabel, opt)
-            painter.restore()
+            # only the transform changed, skip the full state save/restore
+            painter.setTransform(identity)
 
 
 class InstalledPackagesTabBar(VerticalDocTabBar):
@@ -2165,7 +2414,11 @@ class InstalledPackagesWidget(QtWidgets.QWidget):
 
         self._tabs = tabs
         self._search = search
+        self._last_searched = ""
+        self._last_scrolled = None
         self._groups = []
+        self._group_index = {}  # type: dict[str, int]
+        self._tab_jump = {}  # type: dict[str, QtCore.QPersistentModelIndex]
 
     def model(self):
         return self._model
@@ -2176,8 +2429,30 @@ class InstalledPackagesWidget(QtWidgets.QWidget):
     def _deferred_search(self):
         # https://doc.qt.io/qt-5/qregexp.html#introduction
         text = self._search.text()
-        self._proxy.setFilterRegExp(text)
-        self._view.expandAll() if len(text) > 1 else self._view.collapseAll()
+        previous = self._last_searched
+        if text == previous:
+            # e.g. a keystroke typed and undone within the debounce window;
+            # refiltering and expandAll would redo identical work.
+            return
+        self._last_searched = text
+        self._last_scrolled = None  # proxy rows are about to change
+        if _REGEX_METACHARS.intersection(text):
+            self._proxy.setFilterRegExp(_filter_regexp(text))
+        else:
+            # plain substring, take Qt's fixed-string fast path instead of
+            # evaluating a regex per row
+            self._proxy.setFilterFixedString(text)
+        if len(text) > 1:
+            # growing a plain filter only hides rows and the survivors keep
+            # their expansion, so the full-tree expandAll is only needed
+            # when rows may have been revealed
+            grown = (len(previous) > 1
+                     and text.startswith(previous)
+                     and not _REGEX_METACHARS.intersection(text))
+            if not grown:
+                self._view.expandAll()
+        elif len(previous) > 1:
+            self._view.collapseAll()
         self._view.reset_extension()
 
     @QtCore.Slot(str)  # noqa
@@ -2187,11 +2462,18 @@ class InstalledPackagesWidget(QtWidgets.QWidget):
     @QtCore.Slot(int)  # noqa
     def on_tab_clicked(self, index):
         group = self._tabs.tabText(index)
-        item = self._model.first_item_in_initial(group)
-        if item is not None:
-            index = item.index()
-            index = self._proxy.mapFromSource(index)
-            self._view.scroll_at_top(index)
+        p_index = self._tab_jump.get(group)
+        if p_index is None or not p_index.isValid():
+            # mapFromSource over a big filtered set isn't free, keep the
+            # mapping as a persistent index once resolved
+            item = self._model.first_item_in_initial(group)
+            if item is None:
+                return
+            p_index = QtCore.QPersistentModelIndex(
+                self._proxy.mapFromSource(item.index()))
+            self._tab_jump[group] = p_index
+        # PyQt5 view APIs don't take QPersistentModelIndex, convert back
+        self._view.scroll_at_top(QtCore.QModelIndex(p_index))
 
     @QtCore.Slot(int)  # noqa
     def on_scrolled(self, value):
@@ -2199,11 +2481,18 @@ class InstalledPackagesWidget(QtWidgets.QWidget):
             return
 
         index = self._view.top_scrolled_index(value)
+        key = (index.internalId(), index.row())
+        if key == self._last_scrolled:
+            return  # same top row, the tab is already in sync
+        self._last_scrolled = key
+
         index = self._proxy.mapToSource(index)
         name = self._model.data(index)
         if name:
             group = name[0].upper()
-            index = self._groups.index(group)
+            index = self._group_index.get(group)
+            if index is None:
+                return
             self._tabs.blockSignals(True)
             self._tabs.setCurrentIndex(index)
             self._tabs.blockSignals(False)
@@ -2224,6 +2513,7 @@ class InstalledPackagesWidget(QtWidgets.QWidget):
 
             self._groups.reverse()
             for i, group in enumerate(self._groups):
+                self._group_index[group] = i
                 self._tabs.setTabText(i, group)
 
     @QtCore.Slot()  # noqa
@@ -2231,15 +2521,28 @@ class InstalledPackagesWidget(QtWidgets.QWidget):
         # regenerate tabs
         tabs = self._tabs
         self._groups.clear()
-        for index in range(tabs.count()):
-            tabs.removeTab(0)
-
-        for group in self._model.initials():
-            self._groups.append(group)
-            tabs.addTab(group)
-
-        if not self._groups:
-            tabs.addTab("")  # placeholder tab for startup
+        self._group_index.clear()
+        self._tab_jump.clear()
+        self._last_scrolled = None
+        # QTabBar has no clear(), so silence and batch the whole
+        # regeneration to keep the rotated tab bar from relaying out once
+        # per removeTab/addTab; geometry is recomputed once at the end
+        tabs.blockSignals(True)
+        tabs.setUpdatesEnabled(False)
+        try:
+            while tabs.count():
+                tabs.removeTab(0)
+
+            for group in self._model.initials():
+                self._group_index[group] = len(self._groups)
+                self._groups.append(group)
+                tabs.addTab(group)
+
+            if not self._groups:
+                tabs.addTab("")  # placeholder tab for startup
+        finally:
+            tabs.setUpdatesEnabled(True)
+            tabs.blockSignals(False)
 
         # (MacOS) Ensure tab bar *polished* even it's not visible on launch.
         tabs.updateGeometry()
@@ -2251,6 +2554,18 @@ class InstalledPackagesWidget(QtWidgets.QWidget):
         self._tabs.setEnabled(False)
         self.refreshed.emit()
 
+    @QtCore.Slot()  # noqa
+    def on_scan_started(self):
+        # versions stream in batch by batch; keeping dynamic sorting on
+        # would re-sort the whole proxy per batch
+        self._view.setSortingEnabled(False)
+        self._proxy.setDynamicSortFilter(False)
+
+    @QtCore.Slot()  # noqa
+    def on_scan_ended(self):
+        self._proxy.setDynamicSortFilter(True)
+        self._view.setSortingEnabled(True)  # sorts once, by the indicator
+
 
 class SuiteBranchWidget(QtWidgets.QWidget):
     suite_selected = QtCore.Signal(core.SavedSuite)
@@ -2308,12 +2623,28 @@ class SuiteBranchWidget(QtWidgets.QWidget):
         timer.setSingleShot(True)
         timer.timeout.connect(self._deferred_search)
 
+        # menu is reused across right clicks, the clicked suite is kept on
+        # self for the action slots
+        menu = QtWidgets.QMenu(view)
+        open_ = QtWidgets.QAction("Open suite (loaded)", menu)
+        import_ = QtWidgets.QAction("Open suite (import)", menu)
+        explore = QtWidgets.QAction("Show in Explorer", menu)
+        open_.triggered.connect(self._on_menu_open)
+        import_.triggered.connect(self._on_menu_import)
+        explore.triggered.connect(self._on_menu_explore)
+        menu.addAction(open_)
+        menu.addAction(import_)
+        menu.addAction(explore)
+
         self._view = view
         self._proxy = proxy
         self._model = model
         self._timer = timer
         self._search = search
+        self._last_searched = ""
         self._archive = archive
+        self._menu = menu
+        self._menu_suite = None
 
     def _on_refresh_clicked(self):
         as_archived = self._archive.isChecked()
@@ -2355,8 +2686,29 @@ class SuiteBranchWidget(QtWidgets.QWidget):
     def _deferred_search(self):
         # https://doc.qt.io/qt-5/qregexp.html#introduction
         text = self._search.text()
-        self._proxy.setFilterRegExp(text)
-        self._view.expandAll() if len(text) > 1 else self._view.collapseAll()
+        previous = self._last_searched
+        if text == previous:
+            # e.g. a keystroke typed and undone within the debounce window;
+            # refiltering and expandAll would redo identical work.
+            return
+        self._last_searched = text
+        if _REGEX_METACHARS.intersection(text):
+            self._proxy.setFilterRegExp(_filter_regexp(text))
+        else:
+            # plain substring, take Qt's fixed-string fast path instead of
+            # evaluating a regex per row
+            self._proxy.setFilterFixedString(text)
+        if len(text) > 1:
+            # growing a plain filter only hides rows and the survivors keep
+            # their expansion, so the full-tree expandAll is only needed
+            # when rows may have been revealed
+            grown = (len(previous) > 1
+                     and text.startswith(previous)
+                     and not _REGEX_METACHARS.intersection(text))
+            if not grown:
+                self._view.expandAll()
+        elif len(previous) > 1:
+            self._view.collapseAll()
         self._view.reset_extension()
 
     def _on_right_click(self, position):
@@ -2370,34 +2722,19 @@ class SuiteBranchWidget(QtWidgets.QWidget):
         if saved_suite is None:
             return  # right-clicking on the branch
 
-        menu = QtWidgets.QMenu(self._view)
-        open_ = QtWidgets.QAction("Open suite (loaded)", menu)
-        import_ = QtWidgets.QAction("Open suite (import)", menu)
-        explore = QtWidgets.QAction("Show in Explorer", menu)
-
-        def on_open():
-            name = saved_suite.name
-            branch = saved_suite.branch
-            self.suite_load_clicked.emit(name, branch, False)
-
-        def on_import():
-            name = saved_suite.name
-            branch = saved_suite.branch
-            self.suite_load_clicked.emit(name, branch, True)
-
-        def on_explore():
-            lib.open_file_location(saved_suite.path)
+        self._menu_suite = saved_suite
+        self._menu.popup(QtGui.QCursor.pos())
 
-        open_.triggered.connect(on_open)
-        import_.triggered.connect(on_import)
-        explore.triggered.connect(on_explore)
+    def _on_menu_open(self):
+        saved_suite = self._menu_suite
+        self.suite_load_clicked.emit(saved_suite.name, saved_suite.branch, False)
 
-        menu.addAction(open_)
-        menu.addAction(import_)
-        menu.addAction(explore)
+    def _on_menu_import(self):
+        saved_suite = self._menu_suite
+        self.suite_load_clicked.emit(saved_suite.name, saved_suite.branch, True)
 
-        menu.move(QtGui.QCursor.pos())
-        menu.show()
+    def _on_menu_explore(self):
+        lib.open_file_location(self._menu_suite.path)
 
 
 class SuiteInsightWidget(QtWidgets.QWidget):
@@ -2518,21 +2855,27 @@ class SuiteInsightWidget(QtWidgets.QWidget):
         self._name.setText(saved_suite.name)
         self._desc.setPlainText(saved_suite.description)
         self._archive.setChecked(saved_suite.archived)
-        added = self._model.add_suite(saved_suite)
-        item = self._model.find_suite(saved_suite)
-        index = self._proxy.mapFromSource(item.index())
-        self._view.setRootIndex(index)
-
-        if added and not is_branch:
-            if error_message:
-                self._model.set_bad_suite(item, error_message)
-                self._error.set_message(error_message)
-            self._model.update_suite_tools(saved_suite)
-            self._view.expandRecursively(index)
-        else:
-            error_message = self._model.is_bad_suite(item)
-            if error_message:
-                self._error.set_message(error_message)
+        # suite tools arrive as a burst of row insertions right after the
+        # root index moves; keep the view from relaying out per change
+        self._view.setUpdatesEnabled(False)
+        try:
+            added = self._model.add_suite(saved_suite)
+            item = self._model.find_suite(saved_suite)
+            index = self._proxy.mapFromSource(item.index())
+            self._view.setRootIndex(index)
+
+            if added and not is_branch:
+                if error_message:
+                    self._model.set_bad_suite(item, error_message)
+                    self._error.set_message(error_message)
+                self._model.update_suite_tools(saved_suite)
+                self._view.expandRecursively(index)
+            else:
+                error_message = self._model.is_bad_suite(item)
+                if error_message:
+                    self._error.set_message(error_message)
+        finally:
+            self._view.setUpdatesEnabled(True)
 
         self._update_action_buttons(bool(error_message), show_error=added)
         self._ctxs.load(saved_suite)
@@ -2624,6 +2967,12 @@ class RequestCompleter(QtWidgets.QCompleter):
         model = InstalledPackagesModel()
         proxy = CompleterProxyModel()
         proxy.setSourceModel(model)
+        proxy.setSortCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        proxy.sort(0)
+        # note: `CaseInsensitivelySortedModel` below promises Qt a sorted
+        #   model so prefix lookup can binary-search instead of scanning
+        #   every package. The source model appends families in scan order,
+        #   so keep the proxy sorted to actually honor that promise.
         self.setModel(proxy)
 
         self.setCompletionColumn(0)
@@ -2631,6 +2980,8 @@ class RequestCompleter(QtWidgets.QCompleter):
         self.setModelSorting(self.CaseInsensitivelySortedModel)
         self.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
         self.setWrapAround(False)
+        self.setMaxVisibleItems(20)  # keep the popup viewport small for
+        # short prefixes that match thousands of families
 
         self._model = model
         self._proxy = proxy
@@ -2650,11 +3001,16 @@ class CompleterPopup(QtWidgets.QListView):
     def __init__(self, *args, **kwargs):
         super(CompleterPopup, self).__init__(*args, **kwargs)
         self.setObjectName("CompleterPopup")
+        self._applied = None
 
     def showEvent(self, event):
-        self.setStyleSheet(res.get_style_sheet())
         # this seems to be the only way to apply stylesheet to completer
-        # popup.
+        # popup. Themes cache their composed sheet, so identity tells us
+        # whether re-parsing the whole QSS is actually needed this show.
+        sheet = res.get_style_sheet()
+        if sheet is not self._applied:
+            self.setStyleSheet(sheet)
+            self._applied = sheet
         super(CompleterPopup, self).showEvent(event)
 
 
@@ -2670,6 +3026,8 @@ class PrettyTimeLineEdit(QtWidgets.QLineEdit):
         self.setReadOnly(True)
 
         timer = QtCore.QTimer()
+        timer.setSingleShot(True)  # each tick schedules the next one, so a
+        # day-old timestamp stops waking the event loop entirely
         timer.timeout.connect(self._on_ticked)
 
         self._timer = timer
@@ -2682,8 +3040,7 @@ class PrettyTimeLineEdit(QtWidgets.QLineEdit):
         dt = datetime.fromtimestamp(timestamp)
         self.setText(delegates.pretty_date(dt))
         self._dt = dt
-        self._timer.setInterval(1000)  # update every 1 secs for start
-        self._timer.start()
+        self._timer.start(1000)  # update every 1 secs for start
 
     def _on_ticked(self):
         now = datetime.now()
@@ -2693,20 +3050,20 @@ class PrettyTimeLineEdit(QtWidgets.QLineEdit):
         day_diff = diff.days
 
         if day_diff > 0:
-            self._timer.stop()
+            return  # pretty date only counts days now, no more ticking
+        if day_diff < 0:
+            self._timer.start(1000)
             return
-        if day_diff < 0 or second_diff < 10:
-            return  # "just now"
-        if second_diff < 60:
-            pass
-        elif second_diff < 120:
-            self._timer.setInterval(5000)  # change to update every 5 secs
-        elif second_diff < 3600:
-            self._timer.setInterval(30000)  # change to update every 30 secs
-        elif second_diff < 86400:
-            self._timer.setInterval(60000)  # change to update every 60 secs
 
-        self.setText(delegates.pretty_date(self._dt))
+        if second_diff < 120:
+            interval = 1000 if second_diff < 60 else 5000
+        else:
+            interval = 30000 if second_diff < 3600 else 60000
+
+        text = delegates.pretty_date(self._dt)
+        if text != self.text():  # e.g. still "just now"
+            self.setText(text)
+        self._timer.start(interval)
 
 
 class AttribBase(QtWidgets.QWidget):
@@ -2802,28 +3159,33 @@ class AttribList(AttribBase):
 
 class HtmlPrinter(colorize.Printer):
 
+    _span = (lambda c: f'<span style="color:{c};">')
+    # precomputed opening tags, built once per process (a printer is made
+    # per context print), `get` only concatenates per token
+    _html_style = {
+        colorize.critical: _span("red"),
+        colorize.error: _span("red"),
+        colorize.warning: _span("yellow"),
+        colorize.info: _span("green"),
+        colorize.debug: _span("blue"),
+        colorize.heading: _span("white"),
+        colorize.local: _span("green"),
+        colorize.implicit: _span("cyan"),
+        colorize.ephemeral: _span("blue"),
+        colorize.alias: _span("cyan"),
+    }
+    del _span
+
     def __init__(self, buf):
         super(HtmlPrinter, self).__init__(buf=buf)
-        _html = (lambda m, c: f'<span style="color:{c};">{m}</span>')
         self.colorize = True
-        self._html_style = {
-            colorize.critical: lambda m: _html(m,  "red"),
-            colorize.error: lambda m: _html(m,     "red"),
-            colorize.warning: lambda m: _html(m,   "yellow"),
-            colorize.info: lambda m: _html(m,      "green"),
-            colorize.debug: lambda m: _html(m,     "blue"),
-            colorize.heading: lambda m: _html(m,   "white"),
-            colorize.local: lambda m: _html(m,     "green"),
-            colorize.implicit: lambda m: _html(m,  "cyan"),
-            colorize.ephemeral: lambda m: _html(m, "blue"),
-            colorize.alias: lambda m: _html(m,     "cyan"),
-        }
 
     def get(self, msg, style=None):
         if style and self.colorize:
-            _style = self._html_style.get(style)
-            _style = _style or style
-            msg = _style(msg)
+            pre = self._html_style.get(style)
+            if pre is not None:
+                return pre + msg + "</span>"
+            msg = style(msg)
         return msg
 
     @classmethod
@@ -2832,5 +3194,9 @@ class HtmlPrinter(colorize.Printer):
         from rez import resolved_context
         _Printer = getattr(resolved_context, "Printer")
         setattr(resolved_context, "Printer", cls)
-        yield
-        setattr(resolved_context, "Printer", _Printer)
+        try:
+            yield
+        finally:
+            # restore even when e.g. print_info raises on a malformed rxt,
+            # or the Printer stays patched for the rest of the process
+            setattr(resolved_context, "Printer", _Printer)